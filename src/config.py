@@ -11,6 +11,9 @@ class Config:
     RAW_DIR = os.getenv("RAW_DATA_DIR", "data/raw")
     CLEAN_DIR = os.getenv("CLEAN_DATA_DIR", "data/clean")
     REPORT_DIR = os.getenv("REPORT_DIR", "data/reports")
+    USE_POLARS = os.getenv("USE_POLARS", "false").lower() == "true"
+    # Diagnostic logging (e.g. DEBUG); pipeline progress is printed regardless
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING").upper()
 
     @classmethod
     def ensure_dirs(cls):
@@ -1,35 +1,109 @@
+import threading
+import orjson
 import requests
-from typing import List, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Optional, Tuple
 from src.config import Config
 
+# Sentinel returned by conditional fetches when the server answers 304 Not Modified.
+NOT_MODIFIED = object()
+
+
 class APIClient:
     """
     Singleton client for handling external API interactions.
     Handles authentication and error management centrally.
+
+    A single requests.Session with HTTP keep-alive is shared across all calls,
+    so the TCP/TLS handshake is paid once for every pipeline. Transient gateway
+    errors are retried with exponential backoff.
+
+    Successful responses are memoized per action type for the lifetime of the
+    process, so retries or repeated pipeline runs do not hit the network again.
     """
     _instance = None
+    _lock = threading.Lock()
 
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(APIClient, cls).__new__(cls)
+        # Pipelines run in parallel threads, so guard the first construction
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(APIClient, cls).__new__(cls)
+                cls._instance.session = cls._build_session()
+                cls._instance._cache = {}
+                cls._instance._cache_lock = threading.Lock()
         return cls._instance
 
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """
+        Creates a pooled session with retry handling for all API traffic.
+        """
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def clear_cache(self) -> None:
+        """
+        Drops all memoized responses, forcing the next fetches to hit the API.
+        """
+        with self._cache_lock:
+            self._cache.clear()
+
     def fetch_data(self, action_type: str) -> List[Dict[str, Any]]:
         """
         Retrieves raw JSON events for a specific action type.
         """
+        data, _ = self.fetch_conditional(action_type)
+        return data
+
+    def fetch_conditional(self, action_type: str, etag: Optional[str] = None) -> Tuple[Any, Optional[str]]:
+        """
+        Retrieves raw JSON events, revalidating against a previously seen ETag.
+
+        Args:
+            action_type: The event identifier to query.
+            etag: The ETag stored alongside the local cache, if any.
+
+        Returns:
+            Tuple[Any, Optional[str]]: The decoded events (or NOT_MODIFIED when the
+            server confirms the cached copy is current) and the response ETag.
+        """
+        with self._cache_lock:
+            cached = self._cache.get(action_type)
+        if cached is not None:
+            if etag and cached[1] == etag:
+                return NOT_MODIFIED, etag
+            return cached
+
+        headers = {"Authorization": f"Bearer {Config.API_KEY}"}
+        if etag:
+            headers["If-None-Match"] = etag
+
         try:
-            response = requests.get(
+            response = self.session.get(
                 Config.API_URL,
-                headers={"Authorization": f"Bearer {Config.API_KEY}"},
+                headers=headers,
                 params={"action": action_type},
                 timeout=30
             )
+            if response.status_code == 304:
+                return NOT_MODIFIED, etag
             response.raise_for_status()
-            data = response.json()
+            # orjson decodes the raw body in C, much faster than response.json()
+            data = orjson.loads(response.content)
             if not data:
-                return []
-            return data
-        except requests.exceptions.RequestException as e:
+                return [], None
+
+            result = (data, response.headers.get("ETag"))
+            with self._cache_lock:
+                self._cache[action_type] = result
+            return result
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"[ERROR] API Request failed for {action_type}: {e}")
-            return []
\ No newline at end of file
+            return [], None
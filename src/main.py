@@ -1,3 +1,5 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from src.config import Config
 from src.reporting.html_generator import HTMLGenerator
 from src.pipelines.battles import BattlesPipeline
@@ -17,6 +19,7 @@ def main():
     Main entry point for the ETL orchestration.
     Instantiates all pipelines, runs them, aggregates viz data, and builds the report.
     """
+    logging.basicConfig(level=Config.LOG_LEVEL, format="[%(levelname)s] %(name)s: %(message)s")
     print("--- INITIALIZING PIXELMON AI DATA PIPELINES ---")
     Config.ensure_dirs()
 
@@ -36,16 +39,21 @@ def main():
 
     consolidated_viz_data = {}
 
-    # Execute Pipelines
-    for pipeline in pipelines:
-        try:
-            viz_data = pipeline.run()
-            if viz_data:
-                consolidated_viz_data[pipeline.output_name] = viz_data
-        except Exception as e:
-            print(f"[CRITICAL ERROR] Pipeline {pipeline.output_name} failed: {e}")
-            import traceback
-            traceback.print_exc()
+    # Execute Pipelines concurrently. Each pipeline is dominated by I/O
+    # (API fetch, disk reads/writes), so threads overlap that latency.
+    with ThreadPoolExecutor(max_workers=len(pipelines)) as executor:
+        futures = [(pipeline, executor.submit(pipeline.run)) for pipeline in pipelines]
+
+        # Collect results in submission order so the report layout stays stable
+        for pipeline, future in futures:
+            try:
+                viz_data = future.result()
+                if viz_data:
+                    consolidated_viz_data[pipeline.output_name] = viz_data
+            except Exception as e:
+                print(f"[CRITICAL ERROR] Pipeline {pipeline.output_name} failed: {e}")
+                import traceback
+                traceback.print_exception(e)
 
     # Generate Reporting
     print("--- GENERATING FINAL REPORT ---")
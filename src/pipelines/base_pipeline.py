@@ -1,11 +1,80 @@
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
-import json
+import pyarrow as pa
+import pyarrow.parquet as pq
 import ast
+import orjson
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from src.config import Config
-from src.connectors.api_client import APIClient
+from src.connectors.api_client import APIClient, NOT_MODIFIED
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; IV totals fall back to NumPy
+    njit = None
+
+try:
+    import polars as pl
+except ImportError:  # Polars is optional; pipelines run on pandas
+    pl = None
+
+# Max IV total: 6 stats * 31 IVs
+IV_MAX_TOTAL = 186
+
+# Below this size the JIT warmup costs more than it saves
+NUMBA_MIN_ROWS = 5000
+
+# Low-cardinality string columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = (
+    'species', 'death_category', 'result', 'event_type', 'day_of_week',
+    'itemType', 'product_name', 'server_id', 'biome', 'world'
+)
+
+if njit is not None:
+    # nogil rather than parallel=True: pipelines already run in a thread pool,
+    # and Numba's default threading layer does not support concurrent launches.
+    @njit(nogil=True, fastmath=True, cache=True)
+    def _iv_sum_kernel(a):
+        """Row-wise sum of a contiguous float32 IV matrix."""
+        out = np.empty(a.shape[0], np.float32)
+        for i in range(a.shape[0]):
+            s = 0.0
+            for j in range(a.shape[1]):
+                s += a[i, j]
+            out[i] = s
+        return out
+else:
+    _iv_sum_kernel = None
+
+
+def safe_json_load(x: Any) -> Dict:
+    """
+    Attempt to parse a context value into a dictionary safely.
+
+    Strategy:
+    1. Return as-is if already a dict.
+    2. Try orjson.loads (strict JSON, C implementation).
+    3. Fallback to ast.literal_eval for single-quoted Python strings.
+    4. Return empty dict on failure or when the value is not a mapping.
+    """
+    if isinstance(x, dict):
+        return x
+    if not isinstance(x, str):
+        return {}
+
+    try:
+        # Primary attempt: Standard JSON
+        data = orjson.loads(x)
+    except orjson.JSONDecodeError:
+        try:
+            # Fallback attempt: Python string representation (e.g. {'key': 'val'})
+            data = ast.literal_eval(x)
+        except (ValueError, SyntaxError):
+            return {}
+
+    return data if isinstance(data, dict) else {}
 
 
 class BaseDataPipeline(ABC):
@@ -19,10 +88,26 @@ class BaseDataPipeline(ABC):
     Attributes:
         action_type (str): The API event identifier (e.g., 'BATTLE_END').
         output_name (str): The logical name for output files (e.g., 'battles').
-        raw_path (str): File path for storing unprocessed data.
-        clean_path (str): File path for storing the final engineered dataset.
+        raw_path (str): File path for storing unprocessed data (Parquet).
+        legacy_raw_path (str): Pre-Parquet CSV cache location, still honoured when present.
+        etag_path (str): Sidecar file holding the server ETag of the raw cache.
+        clean_path (str): File path for storing the final engineered dataset (Parquet).
+        context_keys (Optional[List[str]]): Keys of a flat, fixed-schema context. When
+            set, the context is expanded directly from these keys instead of json_normalize.
+        supports_polars (bool): Whether the pipeline implements the Polars hooks
+            `_polars_context_schema` (context key -> Polars dtype) and
+            `_feature_engineering_polars` (lazy counterpart of `_feature_engineering`).
+        use_polars (bool): Run the lazy Polars variant of the lifecycle. Ignored
+            unless `supports_polars` is set. Its clean files keep only the declared
+            context keys, so they differ from the pandas output (see `_run_polars`).
+        CHUNK_SIZE (int): Rows per Parquet row group written by `_save_data`.
     """
 
+    context_keys: Optional[List[str]] = None
+    supports_polars: bool = False
+    use_polars: bool = False
+    CHUNK_SIZE: int = 100_000
+
     def __init__(self, action_type: str, output_name: str):
         """
         Initializes the pipeline paths based on the global configuration.
@@ -33,8 +118,10 @@ class BaseDataPipeline(ABC):
         """
         self.action_type = action_type
         self.output_name = output_name
-        self.raw_path = os.path.join(Config.RAW_DIR, f"dataset_{action_type}_raw.csv")
-        self.clean_path = os.path.join(Config.CLEAN_DIR, f"dataset_{output_name}_clean.csv")
+        self.raw_path = os.path.join(Config.RAW_DIR, f"dataset_{action_type}_raw.parquet")
+        self.legacy_raw_path = os.path.join(Config.RAW_DIR, f"dataset_{action_type}_raw.csv")
+        self.etag_path = f"{self.raw_path}.etag"
+        self.clean_path = os.path.join(Config.CLEAN_DIR, f"dataset_{output_name}_clean.parquet")
 
     def run(self) -> Dict[str, Any]:
         """
@@ -49,6 +136,12 @@ class BaseDataPipeline(ABC):
         """
         print(f"--- Starting Pipeline: {self.output_name} ---")
 
+        if self.use_polars and self.supports_polars and pl is not None:
+            try:
+                return self._run_polars()
+            except (pl.exceptions.PolarsError, OSError) as e:
+                print(f"[WARN] Polars execution failed for {self.output_name} ({e}). Falling back to pandas.")
+
         # Retrieve data from the source. This step handles caching logic to
         # prevent unnecessary API calls during development or re-runs.
         df = self._extract_data()
@@ -67,9 +160,10 @@ class BaseDataPipeline(ABC):
         df = self._feature_engineering(df)
 
         # Apply global standard transformations applicable to all datasets,
-        # such as One-Hot Encoding for Server IDs.
+        # such as One-Hot Encoding for Server IDs. Each row belongs to exactly
+        # one server, so the dummies are kept sparse in memory.
         if 'server_id' in df.columns:
-            server_dummies = pd.get_dummies(df['server_id'], prefix='server')
+            server_dummies = pd.get_dummies(df['server_id'], prefix='server', sparse=True, dtype='uint8')
             df = pd.concat([df, server_dummies], axis=1)
 
         # Persist the processed data to the clean directory for future use
@@ -79,40 +173,295 @@ class BaseDataPipeline(ABC):
         # Generate visualization artifacts for the HTML report.
         return self._generate_visualization_data(df)
 
+    def _run_polars(self) -> Dict[str, Any]:
+        """
+        Executes the lifecycle as a single lazy Polars query.
+
+        The raw Parquet cache is scanned lazily; context decoding, feature
+        engineering and the server one-hot encoding are chained onto the plan,
+        which is executed once with the streaming engine. The result is then
+        saved and reported through the pandas helpers.
+
+        The clean file is not identical to the pandas path's: only the context
+        keys declared in `_polars_context_schema` are kept, with the dtypes
+        declared there (integer fields such as durationMs come out as floats),
+        and columns may be ordered differently.
+
+        Returns:
+            Dict[str, Any]: Serialized Plotly figures, as returned by `run`.
+        """
+        if not self._ensure_raw_cache():
+            print(f"[WARN] No data found for {self.action_type}. Aborting pipeline execution.")
+            return {}
+
+        lf = pl.scan_parquet(self.raw_path)
+        lf = self._clean_json_context_polars(lf)
+        lf = self._feature_engineering_polars(lf)
+
+        if 'server_id' in lf.collect_schema().names():
+            servers = lf.select(pl.col('server_id').drop_nulls().unique().sort()).collect()['server_id']
+            lf = lf.with_columns([
+                (pl.col('server_id') == server).cast(pl.UInt8).alias(f"server_{server}")
+                for server in servers
+            ])
+
+        df = lf.collect(engine='streaming')
+        if df.is_empty():
+            print(f"[WARN] No data found for {self.action_type}. Aborting pipeline execution.")
+            return {}
+
+        result = self._to_categorical(df.to_pandas())
+        self._save_data(result)
+
+        return self._generate_visualization_data(result)
+
+    def _clean_json_context_polars(self, lf: "pl.LazyFrame") -> "pl.LazyFrame":
+        """
+        Decodes the 'context_data' column into top-level columns lazily.
+
+        JSON strings are decoded against `_polars_context_schema`; contexts already
+        stored as structs are used directly. As in the pandas path, keys that clash
+        with existing columns are dropped.
+
+        Args:
+            lf (pl.LazyFrame): The raw scan.
+
+        Returns:
+            pl.LazyFrame: The plan with the context fields expanded.
+        """
+        schema = lf.collect_schema()
+        if 'context_data' not in schema.names():
+            return lf
+
+        fields = self._polars_context_schema()
+        context = pl.col('context_data')
+        if schema['context_data'] == pl.String:
+            context = context.str.json_decode(pl.Struct(fields))
+            available = set(fields)
+        else:
+            available = {field.name for field in schema['context_data'].fields}
+
+        columns = []
+        for key, dtype in fields.items():
+            if key in schema.names():
+                continue
+            if key in available:
+                columns.append(context.struct.field(key).cast(dtype, strict=False).alias(key))
+            else:
+                columns.append(pl.lit(None, dtype=dtype).alias(key))
+
+        return lf.with_columns(columns).drop('context_data')
+
     def _extract_data(self) -> pd.DataFrame:
         """
         Retrieves raw data, preferring a local cache if available.
 
         To ensure reproducibility in AI training, local files are prioritized.
-        If the file is missing, it triggers an API fetch via the singleton client.
+        The Parquet cache is preferred; a CSV cache written by older versions is
+        used as a fallback. If neither exists, it triggers an API fetch via the
+        singleton client.
+
+        When the Parquet cache has an ETag sidecar, the cache is revalidated with
+        a conditional request and only replaced if the server has newer data.
 
         Returns:
             pd.DataFrame: The raw dataset.
         """
         if os.path.exists(self.raw_path):
+            refreshed = self._revalidate_raw_cache()
+            if refreshed is not None:
+                return refreshed
+
             print(f"[INFO] Loading cached raw data from {self.raw_path}")
-            return pd.read_csv(self.raw_path)
+            return pd.read_parquet(self.raw_path, engine='pyarrow')
 
+        if os.path.exists(self.legacy_raw_path):
+            print(f"[INFO] Loading legacy CSV cache from {self.legacy_raw_path}")
+            return self._read_csv(self.legacy_raw_path)
+
+        return self._download_raw()
+
+    def _ensure_raw_cache(self) -> bool:
+        """
+        Makes sure an up-to-date Parquet raw cache exists, without loading it.
+
+        Used by the Polars path, which scans the cache lazily. A legacy CSV cache
+        is migrated to Parquet; otherwise the same revalidation and download
+        rules as `_extract_data` apply.
+
+        Returns:
+            bool: True if the Parquet cache holds data to process.
+        """
+        if os.path.exists(self.raw_path):
+            self._revalidate_raw_cache()
+            return True
+
+        if os.path.exists(self.legacy_raw_path):
+            print(f"[INFO] Migrating legacy CSV cache {self.legacy_raw_path} to Parquet")
+            df = self._read_csv(self.legacy_raw_path)
+            if df.empty:
+                return False
+            self._write_raw_cache(df, self.raw_path)
+            return True
+
+        return not self._download_raw().empty
+
+    def _revalidate_raw_cache(self) -> Optional[pd.DataFrame]:
+        """
+        Refreshes the Parquet cache if its ETag shows the server has newer data.
+
+        Returns:
+            Optional[pd.DataFrame]: The new raw dataset if the cache was replaced,
+            otherwise None (no ETag, or the cache is still current).
+        """
+        etag = self._load_etag()
+        if etag is None:
+            return None
+
+        data, new_etag = APIClient().fetch_conditional(self.action_type, etag)
+        if data is NOT_MODIFIED or not data:
+            return None
+
+        print(f"[INFO] Server has newer data for {self.action_type}, refreshing cache")
+        return self._store_raw(data, new_etag)
+
+    def _download_raw(self) -> pd.DataFrame:
+        """
+        Fetches the dataset from the API and stores it as the raw cache.
+
+        Returns:
+            pd.DataFrame: The raw dataset, empty if the API returned nothing.
+        """
         print(f"[INFO] Downloading fresh data for {self.action_type}")
-        client = APIClient()
-        data = client.fetch_data(self.action_type)
+        data, etag = APIClient().fetch_conditional(self.action_type)
 
         if not data:
             return pd.DataFrame()
 
-        df = pd.DataFrame(data)
+        return self._store_raw(data, etag)
+
+    @staticmethod
+    def _read_csv(path: str) -> pd.DataFrame:
+        """
+        Reads a CSV cache with pyarrow's multithreaded parser.
+
+        Falls back to pandas' default C engine when the pyarrow engine is not
+        available or cannot parse the file.
+
+        Args:
+            path (str): Location of the CSV file.
+
+        Returns:
+            pd.DataFrame: The parsed dataset.
+        """
+        try:
+            return pd.read_csv(path, engine='pyarrow')
+        except (ImportError, pa.ArrowInvalid):
+            return pd.read_csv(path)
+
+    def _store_raw(self, data: List[Dict[str, Any]], etag: Optional[str]) -> pd.DataFrame:
+        """
+        Builds the raw DataFrame and persists it, with its ETag, as the local cache.
+
+        Args:
+            data: The decoded API events.
+            etag: The ETag returned by the server, if any.
+
+        Returns:
+            pd.DataFrame: The raw dataset.
+        """
+        try:
+            # Arrow infers column types across all records in C++, avoiding
+            # pandas' row-by-row inference on large event payloads.
+            df = pa.Table.from_struct_array(pa.array(data)).to_pandas()
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Mixed-type fields cannot be typed by Arrow; let pandas use object
+            # columns, which _write_raw_cache stores as text
+            df = pd.DataFrame(data)
 
         # Save raw data immediately to establish the cache.
-        df.to_csv(self.raw_path, index=False)
+        self._write_raw_cache(df, self.raw_path)
+
+        if etag:
+            with open(self.etag_path, 'w', encoding='utf-8') as f:
+                f.write(etag)
+        elif os.path.exists(self.etag_path):
+            os.remove(self.etag_path)
+
         return df
 
+    @classmethod
+    def _write_raw_cache(cls, df: pd.DataFrame, path: str) -> None:
+        """
+        Writes a raw dataset to a zstd-compressed Parquet cache.
+
+        Parquet cannot store some columns as they are: nested shapes such as a
+        context column where every record is an empty dict, or fields whose type
+        varies between events. In that case those columns are stored as text
+        (see `_stringify_object_columns`), which `_clean_json_context` parses
+        just like the original payload.
+
+        Args:
+            df (pd.DataFrame): The raw dataset.
+            path (str): Destination of the cache file.
+        """
+        try:
+            df.to_parquet(path, engine='pyarrow', compression='zstd', index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            df = cls._stringify_object_columns(df)
+            df.to_parquet(path, engine='pyarrow', compression='zstd', index=False)
+
+    @staticmethod
+    def _stringify_object_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Stores nested or mixed-type object columns as text so Arrow can write them.
+
+        Dicts and lists become JSON and other values become str, as the former
+        CSV caches stored them. Missing values stay null, and columns that hold
+        plain scalars of a single type are left untouched.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to convert.
+
+        Returns:
+            pd.DataFrame: A shallow copy with the affected columns as text.
+        """
+        out = df.copy(deep=False)
+        for col in out.select_dtypes(include='object').columns:
+            values = out[col].to_numpy()
+            if not any(isinstance(v, (dict, list)) for v in values):
+                try:
+                    pa.array(values, from_pandas=True)
+                    continue
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    pass
+            out[col] = [
+                orjson.dumps(v).decode() if isinstance(v, (dict, list))
+                else None if pd.isna(v) else str(v)
+                for v in values
+            ]
+        return out
+
+    def _load_etag(self) -> Optional[str]:
+        """
+        Reads the ETag sidecar of the raw cache.
+
+        Returns:
+            Optional[str]: The stored ETag, or None if the cache has none.
+        """
+        if not os.path.exists(self.etag_path):
+            return None
+        with open(self.etag_path, encoding='utf-8') as f:
+            return f.read().strip() or None
+
     def _clean_json_context(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Parses and flattens the 'context_data' column.
 
         This method handles data heterogeneity, specifically coping with both
         standard JSON (double quotes) and Python string literals (single quotes)
-        often introduced during CSV serialization.
+        often introduced during CSV serialization. Pipelines declaring
+        `context_keys` take a fast path that only extracts those keys.
 
         Args:
             df (pd.DataFrame): The DataFrame containing the raw 'context_data' column.
@@ -123,38 +472,18 @@ class BaseDataPipeline(ABC):
         if 'context_data' not in df.columns:
             return df
 
-        def safe_json_load(x: Any) -> Dict:
-            """
-            Attempt to parse a string into a dictionary safely.
-
-            Strategy:
-            1. Return as-is if already a dict.
-            2. Try standard json.loads (strict JSON).
-            3. Fallback to ast.literal_eval for single-quoted Python strings.
-            4. Return empty dict on failure.
-            """
-            if isinstance(x, dict):
-                return x
-            if not isinstance(x, str):
-                return {}
-
-            try:
-                # Primary attempt: Standard JSON
-                return json.loads(x)
-            except (json.JSONDecodeError, TypeError):
-                try:
-                    # Fallback attempt: Python string representation (e.g. {'key': 'val'})
-                    return ast.literal_eval(x)
-                except (ValueError, SyntaxError):
-                    return {}
-
         print(f"[INFO] Expanding JSON context for {self.output_name}...")
 
-        # Apply the safe parser to the context column
-        df['context_data'] = df['context_data'].apply(safe_json_load)
+        # Apply the safe parser over the raw values, bypassing Series.apply overhead
+        parsed = list(map(safe_json_load, df['context_data'].to_numpy()))
 
-        # Normalize the dictionary column into flat columns
-        df_context = pd.json_normalize(df['context_data'])
+        if self.context_keys is not None:
+            # Known shallow schema: build the columns directly, skipping
+            # json_normalize's per-record key discovery and path handling.
+            df_context = pd.DataFrame({k: [d.get(k) for d in parsed] for k in self.context_keys})
+        else:
+            # Normalize the parsed dictionaries into flat columns
+            df_context = pd.json_normalize(parsed)
 
         # Identify and remove columns that already exist in the main DataFrame
         # to avoid duplication conflicts during the join.
@@ -162,17 +491,156 @@ class BaseDataPipeline(ABC):
         if not cols_to_drop.empty:
             df_context = df_context.drop(columns=cols_to_drop)
 
-        # Merge the expanded context back into the main DataFrame and remove the original column
-        return df.join(df_context).drop(columns=['context_data'])
+        # Merge the expanded context back into the main DataFrame and remove the original column.
+        # With a default RangeIndex both frames are already row-aligned, so the columns
+        # are assigned directly instead of paying for join's index alignment.
+        if not df.index.equals(pd.RangeIndex(len(df))):
+            return df.join(df_context).drop(columns=['context_data'])
+
+        df = df.drop(columns=['context_data'])
+        for col in df_context.columns:
+            df[col] = df_context[col].array
+        return df
+
+    def _add_iv_features(self, df: pd.DataFrame, iv_cols: List[str]) -> pd.DataFrame:
+        """
+        Adds 'iv_total' and 'iv_percentage' computed from the given IV columns.
+
+        The IVs are packed into a contiguous float32 matrix and reduced with a
+        Numba kernel for large frames, or NumPy otherwise. Missing IVs count as 0.
+        The percentage is computed in float64 so a perfect total is exactly 100;
+        `_downcast` decides the stored dtype when saving.
+
+        Args:
+            df (pd.DataFrame): DataFrame containing numeric IV columns.
+            iv_cols (List[str]): The IV columns to aggregate.
+
+        Returns:
+            pd.DataFrame: The DataFrame with the IV aggregate columns added.
+        """
+        arr = df[iv_cols].to_numpy(dtype=np.float32, na_value=0.0)
+
+        if _iv_sum_kernel is not None and len(df) > NUMBA_MIN_ROWS:
+            total = _iv_sum_kernel(arr)
+        else:
+            total = arr.sum(axis=1)
+
+        df['iv_total'] = total
+        df['iv_percentage'] = total.astype(np.float64) / IV_MAX_TOTAL * 100
+        return df
+
+    @staticmethod
+    def _top_k(series: pd.Series, k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the k most frequent values of a Series and their counts.
+
+        Equivalent to `series.value_counts().head(k)`, ties included: values with
+        equal counts keep their first-seen (or category) order. The k-th largest
+        count is found with np.partition in O(U), so only the values reaching it
+        are sorted instead of every unique value.
+
+        Args:
+            series (pd.Series): The values to count.
+            k (int): Number of most frequent values to return.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Labels and counts, most frequent first.
+        """
+        vc = series.value_counts(sort=False)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Categoricals also report unobserved categories with a count of 0
+            vc = vc[vc.to_numpy() > 0]
+        counts = vc.to_numpy()
+
+        if len(counts) > k:
+            # Keep every value tied with the k-th count so the cut matches value_counts
+            idx = np.flatnonzero(counts >= np.partition(counts, -k)[-k])
+        else:
+            idx = np.arange(len(counts))
+
+        idx = idx[np.argsort(-counts[idx], kind='stable')][:k]
+        return vc.index.to_numpy()[idx], counts[idx]
+
+    @staticmethod
+    def _to_categorical(df: pd.DataFrame, columns: Tuple[str, ...] = CATEGORICAL_COLUMNS) -> pd.DataFrame:
+        """
+        Stores low-cardinality string columns as pandas categoricals.
+
+        Categoricals keep one small integer code per row instead of a string, so
+        later `value_counts`/`groupby` calls hash codes rather than strings.
+        Group-bys on these columns should pass `observed=True`.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to convert in place.
+            columns (Tuple[str, ...]): Candidate columns; missing ones are skipped.
+
+        Returns:
+            pd.DataFrame: The same DataFrame, with the present columns as categoricals.
+        """
+        for col in columns:
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype('category')
+        return df
+
+    @staticmethod
+    def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Shrinks numeric columns to the smallest dtype that holds their values.
+
+        Integers are downcast via pd.to_numeric and boolean flags are stored as
+        uint8. Float columns become float32 only when every value survives the
+        round-trip exactly, so no precision is lost. The input DataFrame is left
+        untouched.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to downcast.
+
+        Returns:
+            pd.DataFrame: A shallow copy with compact numeric dtypes.
+        """
+        out = df.copy(deep=False)
+        for col in out.select_dtypes(include='integer').columns:
+            downcast = 'unsigned' if out[col].dtype.kind == 'u' else 'integer'
+            out[col] = pd.to_numeric(out[col], downcast=downcast)
+        for col in out.select_dtypes(include='float').columns:
+            values = out[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            if np.array_equal(values, values.astype(np.float32), equal_nan=True):
+                out[col] = pd.to_numeric(out[col], downcast='float')
+        for col in out.select_dtypes(include='bool').columns:
+            out[col] = out[col].astype('uint8')
+        return out
 
     def _save_data(self, df: pd.DataFrame) -> None:
         """
-        Persists the transformed DataFrame to a CSV file.
+        Persists the transformed DataFrame to a Parquet file.
+
+        Sparse columns are densified, since Parquet has no sparse pandas
+        representation (its run-length encoding already compresses them), and
+        numeric columns are downcast so the persisted file stays small. Object
+        columns Arrow cannot type (e.g. a context key that is an int in some
+        events and a string in others) are stored as text. Rows
+        are streamed to disk in row groups of `CHUNK_SIZE`, so only one chunk
+        is converted to Arrow at a time.
 
         Args:
             df (pd.DataFrame): The final cleaned and engineered DataFrame.
         """
-        df.to_csv(self.clean_path, index=False)
+        sparse_cols = [col for col, dtype in df.dtypes.items() if isinstance(dtype, pd.SparseDtype)]
+        if sparse_cols:
+            df = df.copy(deep=False)
+            for col in sparse_cols:
+                df[col] = df[col].sparse.to_dense()
+
+        df = self._downcast(df)
+        try:
+            schema = pa.Schema.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            df = self._stringify_object_columns(df)
+            schema = pa.Schema.from_pandas(df, preserve_index=False)
+        with pq.ParquetWriter(self.clean_path, schema, compression='zstd') as writer:
+            for start in range(0, len(df), self.CHUNK_SIZE):
+                chunk = df.iloc[start:start + self.CHUNK_SIZE]
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
         print(f"[SUCCESS] Saved engineered data to {self.clean_path}")
 
     @abstractmethod
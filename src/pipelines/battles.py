@@ -1,8 +1,13 @@
+import logging
 import pandas as pd
 import re
 import plotly.graph_objects as go
 from typing import Dict, Any
-from src.pipelines.base_pipeline import BaseDataPipeline
+from src.config import Config
+from src.pipelines.base_pipeline import BaseDataPipeline, pl
+from src.pipelines.plotting import to_plot_json
+
+log = logging.getLogger(__name__)
 
 
 class BattlesPipeline(BaseDataPipeline):
@@ -13,6 +18,10 @@ class BattlesPipeline(BaseDataPipeline):
     and generates visualizations for Win Rates and Battle Durations.
     """
 
+    context_keys = ['durationMs', 'result', 'opponentType']
+    supports_polars = True
+    use_polars = Config.USE_POLARS
+
     def __init__(self):
         super().__init__(action_type="BATTLE_END", output_name="battles")
 
@@ -35,13 +44,28 @@ class BattlesPipeline(BaseDataPipeline):
 
         # Normalize result to binary target (1 for WIN, 0 for LOSS)
         if 'result' in df.columns:
-            df['target'] = df['result'].astype(str).str.upper().apply(lambda x: 1 if x == 'WIN' else 0)
+            df['target'] = (df['result'].astype(str).str.upper() == 'WIN').astype('int8')
 
         # ensure opponentType is a string to prevent categorization errors
         if 'opponentType' in df.columns:
             df['opponentType'] = df['opponentType'].astype(str).fillna("Unknown")
 
-        return df
+        # Store repetitive labels as categoricals
+        return self._to_categorical(df)
+
+    def _polars_context_schema(self) -> Dict[str, Any]:
+        return {'durationMs': pl.Float64, 'result': pl.String, 'opponentType': pl.String}
+
+    def _feature_engineering_polars(self, lf: "pl.LazyFrame") -> "pl.LazyFrame":
+        """
+        Polars version of the battle transformations (duration, WIN/LOSS target).
+        """
+        return lf.with_columns(
+            pl.col('durationMs').fill_null(0),
+            (pl.col('durationMs').fill_null(0) / 1000).alias('duration_sec'),
+            (pl.col('result').str.to_uppercase() == 'WIN').fill_null(False).cast(pl.Int8).alias('target'),
+            pl.col('opponentType').fill_null("Unknown"),
+        )
 
     def _generate_visualization_data(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -53,7 +77,9 @@ class BattlesPipeline(BaseDataPipeline):
         """
         plots = {}
 
-        print(f"--- [DEBUG] BATTLES PIPELINE: Processing {len(df)} rows ---")
+        log.debug("BATTLES PIPELINE: Processing %d rows", len(df))
+        if df.empty:
+            return plots
 
         # Win Rate Visualization
         if 'opponentType' in df.columns and 'target' in df.columns:
@@ -61,13 +87,12 @@ class BattlesPipeline(BaseDataPipeline):
             win_rates = df.groupby('opponentType')['target'].mean().reset_index()
             win_rates = win_rates.sort_values(by='target', ascending=False)
 
-            # Convert to native Python lists for JSON serialization safety
-            x_data = win_rates['opponentType'].tolist()
-            y_data = win_rates['target'].tolist()
+            x_data = win_rates['opponentType'].to_numpy()
+            y_data = win_rates['target'].to_numpy()
 
-            print(f"[DEBUG] Win Rate Data (X): {x_data}")
+            log.debug("Win Rate Data (X): %s", x_data)
 
-            if x_data:
+            if x_data.size:
                 fig = go.Figure()
                 fig.add_trace(go.Bar(
                     x=x_data,
@@ -81,18 +106,18 @@ class BattlesPipeline(BaseDataPipeline):
                 fig.update_layout(
                     title="Win Probability by Opponent",
                     yaxis=dict(title='Win Rate', range=[0, 1.1]),
-                    xaxis=dict(title='Opponent Type'),
-                    template="plotly_white"
+                    xaxis=dict(title='Opponent Type')
                 )
 
-                plots['win_rate'] = fig.to_json()
+                plots['win_rate'] = to_plot_json(fig)
 
         # Duration Visualization
         if 'duration_sec' in df.columns:
-            # Filter valid durations
-            durations = df[df['duration_sec'] > 0]['duration_sec'].tolist()
+            # Filter valid durations with a NumPy mask; Plotly takes the array as-is
+            arr = df['duration_sec'].to_numpy()
+            durations = arr[arr > 0]
 
-            if durations:
+            if durations.size:
                 fig2 = go.Figure(data=[go.Histogram(
                     x=durations,
                     nbinsx=30,
@@ -102,9 +127,8 @@ class BattlesPipeline(BaseDataPipeline):
                 fig2.update_layout(
                     title="Battle Duration Distribution (Seconds)",
                     xaxis_title="Seconds",
-                    yaxis_title="Count",
-                    template="plotly_white"
+                    yaxis_title="Count"
                 )
-                plots['duration'] = fig2.to_json()
+                plots['duration'] = to_plot_json(fig2)
 
         return plots
\ No newline at end of file
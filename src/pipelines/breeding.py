@@ -1,8 +1,11 @@
+import logging
 import pandas as pd
-import json
 import plotly.graph_objects as go
 from typing import Dict, Any
-from src.pipelines.base_pipeline import BaseDataPipeline
+from src.pipelines.base_pipeline import BaseDataPipeline, safe_json_load
+from src.pipelines.plotting import to_plot_json
+
+log = logging.getLogger(__name__)
 
 
 class BreedingPipeline(BaseDataPipeline):
@@ -13,6 +16,16 @@ class BreedingPipeline(BaseDataPipeline):
     analyzes breeding trends and genetic quality.
     """
 
+    # Flattened context keys mapped to the engineered IV column names
+    IV_COLUMNS = {
+        'ivs_PS_IV': 'iv_hp',
+        'ivs_ATTACK_IV': 'iv_atk',
+        'ivs_DEFENCE_IV': 'iv_def',
+        'ivs_SP_ATTACK_IV': 'iv_spa',
+        'ivs_SP_DEFENSE_IV': 'iv_spd',
+        'ivs_SPEED_IV': 'iv_spe',
+    }
+
     def __init__(self):
         super().__init__(action_type="POKEMON_BRED", output_name="breeding")
 
@@ -21,35 +34,35 @@ class BreedingPipeline(BaseDataPipeline):
         Parses nested JSON structures within the 'context_data' column.
 
         Specific handling for breeding includes extracting species,
-        shiny status, and detailed IV stats.
+        shiny status, and detailed IV stats. The context is flattened in a
+        single vectorized pass with json_normalize instead of row-wise apply.
         """
         if df.empty: return df
 
-        def parse_deep_context(row):
-            try:
-                # Parse JSON if string, otherwise use directly
-                raw_data = row.get('context_data', '{}')
-                data = json.loads(raw_data) if isinstance(raw_data, str) else raw_data
-
-                if not isinstance(data, dict):
-                    return pd.Series({})
-
-                ivs = data.get('ivs', {})
-                return pd.Series({
-                    'species': data.get('species', 'unknown'),
-                    'is_shiny': 1 if data.get('isShiny', False) else 0,
-                    'iv_hp': ivs.get('PS_IV', 0),
-                    'iv_atk': ivs.get('ATTACK_IV', 0),
-                    'iv_def': ivs.get('DEFENCE_IV', 0),
-                    'iv_spa': ivs.get('SP_ATTACK_IV', 0),
-                    'iv_spd': ivs.get('SP_DEFENSE_IV', 0),
-                    'iv_spe': ivs.get('SPEED_IV', 0)
-                })
-            except Exception:
-                return pd.Series({})
-
-        extracted = df.apply(parse_deep_context, axis=1)
-        return pd.concat([df, extracted], axis=1)
+        if 'context_data' in df.columns:
+            parsed = list(map(safe_json_load, df['context_data'].to_numpy()))
+        else:
+            parsed = [{}] * len(df)
+
+        flat = pd.json_normalize(parsed, sep='_')
+        flat.index = df.index
+
+        # Assign the extracted columns in place; both frames share df's index,
+        # so this skips the index alignment a concat would perform.
+        # Arrow-built frames fill absent fields with None, so a null species is
+        # treated as missing and becomes 'unknown' whatever the cache format
+        df['species'] = [
+            'unknown' if data.get('species') is None else data['species'] for data in parsed
+        ]
+        if 'isShiny' in flat.columns:
+            df['is_shiny'] = flat['isShiny'].fillna(False).astype(bool).astype('int8').array
+        else:
+            df['is_shiny'] = 0
+
+        for source, target in self.IV_COLUMNS.items():
+            df[target] = flat[source].fillna(0).array if source in flat.columns else 0
+
+        return df
 
     def _feature_engineering(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -59,32 +72,33 @@ class BreedingPipeline(BaseDataPipeline):
 
         # Ensure numeric types for IV columns
         iv_cols = ['iv_hp', 'iv_atk', 'iv_def', 'iv_spa', 'iv_spd', 'iv_spe']
+        present = [col for col in iv_cols if col in df.columns]
+        if present:
+            df[present] = df[present].apply(pd.to_numeric, errors='coerce').fillna(0)
         for col in iv_cols:
             if col not in df.columns:
                 df[col] = 0
-            else:
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
 
         # Calculate Total IV and Percentage
-        df['iv_total'] = df[iv_cols].sum(axis=1)
-        df['iv_percentage'] = (df['iv_total'] / 186) * 100
+        df = self._add_iv_features(df, iv_cols)
 
-        return df
+        # Store repetitive labels as categoricals
+        return self._to_categorical(df)
 
     def _generate_visualization_data(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
         Creates visualizations for breeding statistics.
         """
         plots = {}
-        print(f"--- [DEBUG] BREEDING PIPELINE: Processing {len(df)} rows ---")
+        log.debug("BREEDING PIPELINE: Processing %d rows", len(df))
+        if df.empty:
+            return plots
 
         # Top Bred Species Chart
         if 'species' in df.columns:
-            counts = df['species'].value_counts().head(10)
-            y_data = counts.index.tolist()
-            x_data = counts.values.tolist()
+            y_data, x_data = self._top_k(df['species'], 10)
 
-            if x_data:
+            if x_data.size:
                 fig = go.Figure(data=[go.Bar(
                     x=x_data,
                     y=y_data,
@@ -96,20 +110,19 @@ class BreedingPipeline(BaseDataPipeline):
                 fig.update_layout(
                     title="Top 10 Bred Species",
                     xaxis_title="Count",
-                    template="plotly_white",
                     yaxis={'categoryorder': 'total ascending'}
                 )
-                plots['top_bred'] = fig.to_json()
+                plots['top_bred'] = to_plot_json(fig)
 
         # Genetic Quality Distribution
         if 'iv_percentage' in df.columns:
-            iv_data = df['iv_percentage'].tolist()
+            iv = df['iv_percentage'].to_numpy()
             # Filter valid percentages
-            iv_data = [x for x in iv_data if 0 <= x <= 100]
+            iv_data = iv[(iv >= 0) & (iv <= 100)]
 
-            print(f"[DEBUG] Valid IV Percentage points: {len(iv_data)}")
+            log.debug("Valid IV Percentage points: %d", len(iv_data))
 
-            if iv_data:
+            if iv_data.size:
                 fig2 = go.Figure(data=[go.Histogram(
                     x=iv_data,
                     nbinsx=20,
@@ -120,9 +133,8 @@ class BreedingPipeline(BaseDataPipeline):
                     title="Genetic Quality Distribution (IV %)",
                     xaxis_title="IV Percentage (0-100%)",
                     yaxis_title="Count",
-                    template="plotly_white",
                     xaxis=dict(range=[0, 100])
                 )
-                plots['iv_dist'] = fig2.to_json()
+                plots['iv_dist'] = to_plot_json(fig2)
 
         return plots
\ No newline at end of file
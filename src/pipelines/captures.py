@@ -1,7 +1,9 @@
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from typing import Dict, Any
 from src.pipelines.base_pipeline import BaseDataPipeline
+from src.pipelines.plotting import to_plot_json
 
 class CapturesPipeline(BaseDataPipeline):
     """
@@ -29,15 +31,14 @@ class CapturesPipeline(BaseDataPipeline):
         if iv_cols:
             # Fill NaN with 0 to ensure valid numeric operations
             df[iv_cols] = df[iv_cols].fillna(0)
-            df['iv_total'] = df[iv_cols].sum(axis=1)
-            # Max possible IV total is 186
-            df['iv_percentage'] = (df['iv_total'] / 186) * 100
+            df = self._add_iv_features(df, iv_cols)
 
         # Create binary Shiny flag (1/0)
         if 'shiny' in df.columns:
-            df['is_shiny'] = df['shiny'].apply(lambda x: 1 if x else 0)
+            df['is_shiny'] = df['shiny'].fillna(False).astype(bool).astype('int8')
 
-        return df
+        # Store repetitive labels as categoricals
+        return self._to_categorical(df)
 
     def _generate_visualization_data(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -54,11 +55,14 @@ class CapturesPipeline(BaseDataPipeline):
             Dict[str, Any]: JSON-serialized Plotly figures.
         """
         plots = {}
+        if df.empty:
+            return plots
 
         # Visualization: Distribution of Pokémon Quality (IV %)
         if 'iv_percentage' in df.columns:
-            # Convert to native list and drop NaNs for safe serialization
-            clean_ivs = pd.to_numeric(df['iv_percentage'], errors='coerce').dropna().tolist()
+            # iv_percentage is already numeric; drop non-finite values and hand Plotly the ndarray
+            clean_ivs = df['iv_percentage'].to_numpy(dtype=np.float32, na_value=np.nan)
+            clean_ivs = clean_ivs[np.isfinite(clean_ivs)]
 
             fig = go.Figure(data=[go.Histogram(
                 x=clean_ivs,
@@ -72,16 +76,12 @@ class CapturesPipeline(BaseDataPipeline):
                 yaxis_title="Count",
                 bargap=0.1
             )
-            plots['iv_dist'] = fig.to_json()
+            plots['iv_dist'] = to_plot_json(fig)
 
         # Visualization: Top 10 Most Captured Pokémon
         if 'species' in df.columns:
             # Count frequencies and select Top 10
-            top_species = df['species'].value_counts().head(10)
-
-            # Extract native lists for Plotly
-            species_names = top_species.index.tolist()
-            species_counts = top_species.values.tolist()
+            species_names, species_counts = self._top_k(df['species'], 10)
 
             fig2 = go.Figure(data=[go.Bar(
                 x=species_counts,
@@ -94,6 +94,6 @@ class CapturesPipeline(BaseDataPipeline):
                 xaxis_title="Capture Count",
                 yaxis=dict(autorange="reversed")  # Invert axis so #1 is at the top
             )
-            plots['top_captured'] = fig2.to_json()
+            plots['top_captured'] = to_plot_json(fig2)
 
         return plots
\ No newline at end of file
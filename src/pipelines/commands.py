@@ -2,6 +2,9 @@ import pandas as pd
 import plotly.express as px
 from typing import Dict, Any
 from src.pipelines.base_pipeline import BaseDataPipeline
+from src.pipelines.plotting import to_plot_json
+
+TELEPORT_COMMANDS = frozenset(['/home', '/warp', '/tpa', '/tpaccept', '/back', '/spawn', '/rtp'])
 
 class CommandsPipeline(BaseDataPipeline):
     def __init__(self):
@@ -9,19 +12,23 @@ class CommandsPipeline(BaseDataPipeline):
 
     def _feature_engineering(self, df: pd.DataFrame) -> pd.DataFrame:
         if 'command' in df.columns:
+            commands = df['command'].astype('string')
             # Extract base command
-            df['base_command'] = df['command'].astype(str).apply(lambda x: x.split(' ')[0])
+            df['base_command'] = commands.str.split(' ', n=1).str.get(0).astype('category')
             # Length
-            df['cmd_length'] = df['command'].astype(str).apply(len)
+            df['cmd_length'] = commands.str.len().fillna(0).astype('int32')
             # Teleport detection
-            tp_kw = ['/home', '/warp', '/tpa', '/tpaccept', '/back', '/spawn', '/rtp']
-            df['is_teleport'] = df['base_command'].isin(tp_kw)
-        return df
+            df['is_teleport'] = df['base_command'].isin(TELEPORT_COMMANDS).astype('uint8')
+        # Store repetitive labels as categoricals
+        return self._to_categorical(df)
 
     def _generate_visualization_data(self, df: pd.DataFrame) -> Dict[str, Any]:
         plots = {}
+        if df.empty:
+            return plots
         if 'base_command' in df.columns:
-            top = df['base_command'].value_counts().head(10).reset_index()
+            commands, counts = self._top_k(df['base_command'], 10)
+            top = pd.DataFrame({'base_command': commands, 'count': counts})
             fig = px.bar(top, x='count', y='base_command', title="Top Commands")
-            plots['top_cmds'] = fig.to_json()
+            plots['top_cmds'] = to_plot_json(fig)
         return plots
\ No newline at end of file
@@ -1,7 +1,9 @@
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from typing import Dict, Any
 from src.pipelines.base_pipeline import BaseDataPipeline
+from src.pipelines.plotting import hist_trace, to_plot_json
 
 class DeathsPipeline(BaseDataPipeline):
     """
@@ -24,24 +26,27 @@ class DeathsPipeline(BaseDataPipeline):
         Returns:
             pd.DataFrame: Augmented DataFrame with categories (PvE, PvP, Gravity, etc.).
         """
-        def categorize(cause):
-            """Maps specific damage source strings to broad categories."""
-            c = str(cause).lower()
-            if 'fall' in c or 'kinetic' in c: return 'Gravity'
-            if 'mob' in c or 'arrow' in c: return 'PvE'
-            if 'player' in c: return 'PvP'
-            if 'lava' in c or 'fire' in c: return 'Fire'
-            if 'drown' in c: return 'Drowning'
-            return 'Other'
-
         if 'cause' in df.columns:
-            df['death_category'] = df['cause'].apply(categorize)
+            # Map damage source strings to broad categories; np.select keeps the
+            # first matching condition, so the order below sets precedence.
+            cause = df['cause'].astype('string').str.lower()
+            conditions = [
+                cause.str.contains('fall|kinetic', regex=True, na=False),
+                cause.str.contains('mob|arrow', regex=True, na=False),
+                cause.str.contains('player', regex=False, na=False),
+                cause.str.contains('lava|fire', regex=True, na=False),
+                cause.str.contains('drown', regex=False, na=False),
+            ]
+            choices = ['Gravity', 'PvE', 'PvP', 'Fire', 'Drowning']
+            df['death_category'] = pd.Categorical(np.select(conditions, choices, default='Other'))
 
         if 'level' in df.columns:
             df['level'] = pd.to_numeric(df['level'], errors='coerce').fillna(0)
-            df['is_high_level'] = df['level'] > 30
+            # Compare on the raw ndarray to get a plain bool column without Series overhead
+            df['is_high_level'] = df['level'].to_numpy() > 30
 
-        return df
+        # Store repetitive labels as categoricals
+        return self._to_categorical(df)
 
     def _generate_visualization_data(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -59,24 +64,26 @@ class DeathsPipeline(BaseDataPipeline):
             Dict[str, Any]: JSON-serialized Plotly figures.
         """
         plots = {}
+        if df.empty:
+            return plots
 
         # Visualization: Main Causes of Death
         if 'death_category' in df.columns:
             counts = df['death_category'].value_counts()
             fig = go.Figure(data=[go.Pie(
-                labels=counts.index.tolist(),
-                values=counts.values.tolist(),
+                labels=counts.index.to_numpy(),
+                values=counts.to_numpy(),
                 hole=0.3
             )])
             fig.update_layout(title="Main Causes of Death")
-            plots['causes'] = fig.to_json()
+            plots['causes'] = to_plot_json(fig)
 
         # Visualization: Deadliest Biomes (Top 5)
         if 'biome' in df.columns:
-            top_biomes = df['biome'].value_counts().head(5)
+            biomes, counts = self._top_k(df['biome'], 5)
             fig2 = go.Figure(data=[go.Bar(
-                y=top_biomes.index.tolist(),
-                x=top_biomes.values.tolist(),
+                y=biomes,
+                x=counts,
                 orientation='h',
                 marker=dict(color='salmon')
             )])
@@ -85,21 +92,19 @@ class DeathsPipeline(BaseDataPipeline):
                 xaxis_title="Number of Deaths",
                 yaxis=dict(autorange="reversed")  # Invert axis so #1 is at the top
             )
-            plots['deadliest_biomes'] = fig2.to_json()
+            plots['deadliest_biomes'] = to_plot_json(fig2)
 
         # Visualization: Player Level Distribution
         if 'level' in df.columns:
-            levels = pd.to_numeric(df['level'], errors='coerce').dropna().tolist()
-            fig3 = go.Figure(data=[go.Histogram(
-                x=levels,
-                marker_color='red',
-                nbinsx=20
-            )])
+            # level was coerced to numeric during feature engineering
+            levels = df['level'].to_numpy(dtype=np.float64, na_value=np.nan)
+            levels = levels[np.isfinite(levels)]
+            fig3 = go.Figure(data=[hist_trace(levels, 20, marker_color='red')])
             fig3.update_layout(
                 title="Player Level at Death",
                 xaxis_title="Level",
                 yaxis_title="Frequency"
             )
-            plots['level_dist'] = fig3.to_json()
+            plots['level_dist'] = to_plot_json(fig3)
 
         return plots
\ No newline at end of file
@@ -1,8 +1,12 @@
-import pandas as pd
 import re
+import pandas as pd
 import plotly.graph_objects as go
 from typing import Dict, Any
 from src.pipelines.base_pipeline import BaseDataPipeline
+from src.pipelines.plotting import to_plot_json
+
+# Pokémon listings are described as "<Name> Lvl<level>"
+_LVL_RE = re.compile(r'(?P<product_name>.+)\s+Lvl(?P<level>\d+)')
 
 class EconomyPipeline(BaseDataPipeline):
     """
@@ -20,7 +24,7 @@ class EconomyPipeline(BaseDataPipeline):
         Parses item descriptions and normalizes price data.
 
         Extracts the Pokémon species and level from the raw description string
-        (e.g., "Pikachu Lvl5") using regex.
+        (e.g., "Pikachu Lvl5") using a vectorized regex.
 
         Args:
             df (pd.DataFrame): Raw transaction data.
@@ -28,32 +32,34 @@ class EconomyPipeline(BaseDataPipeline):
         Returns:
             pd.DataFrame: DataFrame with extracted product names and numeric levels.
         """
-        def parse_desc(row):
-            """Helper to extract Name and Level from description string."""
-            desc = str(row.get('description', ''))
-            itype = row.get('itemType', 'ITEM')
-            name = desc
-            lvl = 0
-
-            if itype == 'POKEMON':
-                # Regex to extract "Name LvlX" pattern
-                match = re.search(r'(.+)\s+Lvl(\d+)', desc)
-                if match:
-                    name = match.group(1).strip()
-                    lvl = int(match.group(2))
-            return pd.Series([name, lvl])
-
-        # Apply parsing logic
-        df[['product_name', 'level']] = df.apply(parse_desc, axis=1)
-
-        # Ensure numeric types for price and level
-        if 'price' in df.columns:
-            df['price'] = pd.to_numeric(df['price'], errors='coerce').fillna(0)
+        if 'description' in df.columns:
+            descriptions = df['description'].astype(str)
+        else:
+            descriptions = pd.Series('', index=df.index, dtype=str)
+
+        # Default: the description is the product name and there is no level
+        df['product_name'] = descriptions
+        df['level'] = 0
+
+        if 'itemType' in df.columns:
+            # Extract "Name LvlX" for Pokémon listings in a single vectorized regex pass
+            is_pokemon = df['itemType'].eq('POKEMON')
+            extracted = descriptions[is_pokemon].str.extract(_LVL_RE)
+            extracted = extracted[extracted['level'].notna()]
+
+            df.loc[extracted.index, 'product_name'] = extracted['product_name'].str.strip()
+            df.loc[extracted.index, 'level'] = extracted['level'].astype(int)
+
+        # Ensure numeric types for price and listing duration in a single pass
+        num_cols = [c for c in ('price', 'listingDurationMs') if c in df.columns]
+        if num_cols:
+            df[num_cols] = df[num_cols].apply(pd.to_numeric, errors='coerce').fillna(0)
 
         if 'listingDurationMs' in df.columns:
-            df['hours_on_market'] = pd.to_numeric(df['listingDurationMs'], errors='coerce').fillna(0) / 3.6e6
+            df['hours_on_market'] = df['listingDurationMs'].to_numpy() * (1 / 3.6e6)
 
-        return df
+        # Store repetitive labels as categoricals
+        return self._to_categorical(df)
 
     def _generate_visualization_data(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -71,17 +77,24 @@ class EconomyPipeline(BaseDataPipeline):
             Dict[str, Any]: JSON-serialized Plotly figures.
         """
         plots = {}
+        if df.empty:
+            return plots
 
-        # Filter only Pokémon sales for cleaner analysis
-        pokemon_sales = df[df['itemType'] == 'POKEMON'].copy() if 'itemType' in df.columns else df.copy()
+        # Filter only Pokémon sales for cleaner analysis, keeping just the charted columns.
+        # The charts only read from this frame, so no defensive copy is needed.
+        sale_cols = [c for c in ('product_name', 'level', 'price') if c in df.columns]
+        if 'itemType' in df.columns:
+            pokemon_sales = df.loc[df['itemType'].eq('POKEMON').to_numpy(), sale_cols]
+        else:
+            pokemon_sales = df[sale_cols]
 
         # Visualization: Top 10 Most Expensive Species (Avg Price)
         if not pokemon_sales.empty and 'product_name' in pokemon_sales.columns and 'price' in pokemon_sales.columns:
-            avg_prices = pokemon_sales.groupby('product_name')['price'].mean().sort_values(ascending=False).head(10)
+            avg_prices = pokemon_sales.groupby('product_name', observed=True)['price'].mean().sort_values(ascending=False).head(10)
 
             fig = go.Figure(data=[go.Bar(
-                x=avg_prices.values.tolist(),
-                y=avg_prices.index.tolist(),
+                x=avg_prices.to_numpy(),
+                y=avg_prices.index.to_numpy(),
                 orientation='h',
                 marker=dict(color='gold')
             )])
@@ -90,24 +103,24 @@ class EconomyPipeline(BaseDataPipeline):
                 xaxis_title="Average Price",
                 yaxis=dict(autorange="reversed")
             )
-            plots['top_expensive'] = fig.to_json()
+            plots['top_expensive'] = to_plot_json(fig)
 
         # Visualization: Price vs Level Correlation
         if not pokemon_sales.empty and 'level' in pokemon_sales.columns and 'price' in pokemon_sales.columns:
             scatter_df = pokemon_sales[['level', 'price', 'product_name']].dropna()
 
             fig2 = go.Figure(data=[go.Scatter(
-                x=scatter_df['level'].tolist(),
-                y=scatter_df['price'].tolist(),
+                x=scatter_df['level'].to_numpy(),
+                y=scatter_df['price'].to_numpy(),
                 mode='markers',
                 marker=dict(
                     size=10,
-                    color=scatter_df['price'].tolist(),  # Color mapping by price
+                    color=scatter_df['price'].to_numpy(),  # Color mapping by price
                     colorscale='Viridis',
                     showscale=True,
                     colorbar=dict(title="Price")
                 ),
-                text=scatter_df['product_name'].tolist(),  # Tooltip
+                text=scatter_df['product_name'].to_numpy(),  # Tooltip
                 hovertemplate='<b>%{text}</b><br>Level: %{x}<br>Price: %{y}<extra></extra>'
             )])
             fig2.update_layout(
@@ -115,15 +128,15 @@ class EconomyPipeline(BaseDataPipeline):
                 xaxis_title="Level",
                 yaxis_title="Price"
             )
-            plots['price_scatter'] = fig2.to_json()
+            plots['price_scatter'] = to_plot_json(fig2)
 
         # Visualization: Transactions Volume by Server
         if 'server_id' in df.columns:
             server_counts = df['server_id'].value_counts()
 
             fig3 = go.Figure(data=[go.Bar(
-                x=server_counts.index.tolist(),
-                y=server_counts.values.tolist(),
+                x=server_counts.index.to_numpy(),
+                y=server_counts.to_numpy(),
                 marker_color='cornflowerblue'
             )])
             fig3.update_layout(
@@ -131,6 +144,6 @@ class EconomyPipeline(BaseDataPipeline):
                 xaxis_title="Server ID",
                 yaxis_title="Transaction Count"
             )
-            plots['server_volume'] = fig3.to_json()
+            plots['server_volume'] = to_plot_json(fig3)
 
         return plots
\ No newline at end of file
@@ -1,7 +1,12 @@
+import logging
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from typing import Dict, Any
 from src.pipelines.base_pipeline import BaseDataPipeline
+from src.pipelines.plotting import to_plot_json
+
+log = logging.getLogger(__name__)
 
 
 class RaidsPipeline(BaseDataPipeline):
@@ -20,47 +25,44 @@ class RaidsPipeline(BaseDataPipeline):
         """
         if df.empty: return df
 
-        # Corrects column swap between 'world' and 'biome'
-        print("[INFO] Applying Critical Fix: Swapping World and Biome columns.")
+        # Corrects column swap between 'world' and 'biome' (relabel only, no data is copied)
         if 'world' in df.columns and 'biome' in df.columns:
-            real_worlds = df['biome'].copy()
-            real_biomes = df['world'].copy()
-            df['world'] = real_worlds
-            df['biome'] = real_biomes
+            log.debug("Swapping World and Biome column labels.")
+            df.rename(columns={'world': 'biome', 'biome': 'world'}, inplace=True)
 
         # Standardize 'result' column
         if 'result' in df.columns:
             df['result'] = df['result'].astype(str).fillna("UNKNOWN")
 
-        return df
+        # Store repetitive labels as categoricals
+        return self._to_categorical(df)
 
     def _generate_visualization_data(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
         Visualizes Raid outcomes (Wins vs Losses).
         """
         plots = {}
-        print(f"--- [DEBUG] RAIDS PIPELINE: Processing {len(df)} rows ---")
+        log.debug("RAIDS PIPELINE: Processing %d rows", len(df))
+        if df.empty:
+            return plots
 
         # Raid Win/Loss Ratio
         if 'result' in df.columns:
             counts = df['result'].value_counts()
 
-            x_data = counts.index.tolist()
-            y_data = counts.values.tolist()
+            x_data = counts.index.to_numpy()
+            y_data = counts.to_numpy()
 
-            print(f"[DEBUG] Raid Results: {x_data}")
+            log.debug("Raid Results: %s", x_data)
 
-            if x_data:
-                # Color coding based on result
-                colors = []
-                for res in x_data:
-                    res_upper = res.upper()
-                    if 'WIN' in res_upper or 'VICTORY' in res_upper:
-                        colors.append('#2ecc71')  # Green
-                    elif 'LOSS' in res_upper or 'DEFEAT' in res_upper:
-                        colors.append('#e74c3c')  # Red
-                    else:
-                        colors.append('#95a5a6')  # Grey
+            if x_data.size:
+                # Color coding based on result: green for wins, red for losses, grey otherwise
+                results = counts.index.astype(str).str.upper()
+                colors = np.select(
+                    [results.str.contains('WIN|VICTORY', regex=True), results.str.contains('LOSS|DEFEAT', regex=True)],
+                    ['#2ecc71', '#e74c3c'],
+                    default='#95a5a6'
+                )
 
                 fig = go.Figure(data=[go.Bar(
                     x=x_data,
@@ -72,9 +74,8 @@ class RaidsPipeline(BaseDataPipeline):
                 fig.update_layout(
                     title="Raid Outcomes (Win/Loss)",
                     xaxis_title="Result",
-                    yaxis_title="Count",
-                    template="plotly_white"
+                    yaxis_title="Count"
                 )
-                plots['raid_results'] = fig.to_json()
+                plots['raid_results'] = to_plot_json(fig)
 
         return plots
\ No newline at end of file
@@ -1,7 +1,9 @@
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from typing import Dict, Any
 from src.pipelines.base_pipeline import BaseDataPipeline
+from src.pipelines.plotting import hist_trace, to_plot_json
 
 class ReleasedPipeline(BaseDataPipeline):
     """
@@ -28,15 +30,15 @@ class ReleasedPipeline(BaseDataPipeline):
         iv_cols = [c for c in df.columns if c.startswith('ivs.')]
         if iv_cols:
             df[iv_cols] = df[iv_cols].fillna(0)
-            df['iv_total'] = df[iv_cols].sum(axis=1)
-            # Max stats: 6 stats * 31 IVs = 186
-            df['iv_percentage'] = (df['iv_total'] / 186) * 100
+            df = self._add_iv_features(df, iv_cols)
 
         # Convert ownership time from milliseconds to minutes
         if 'timeHeldCalculated' in df.columns:
-            df['minutes_owned'] = df['timeHeldCalculated'] / 60000
+            held_ms = df['timeHeldCalculated'].to_numpy(dtype=np.float64, na_value=np.nan)
+            df['minutes_owned'] = held_ms / 60000
 
-        return df
+        # Store repetitive labels as categoricals
+        return self._to_categorical(df)
 
     def _generate_visualization_data(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -49,22 +51,22 @@ class ReleasedPipeline(BaseDataPipeline):
             Dict[str, Any]: JSON-serialized Plotly figures.
         """
         plots = {}
+        if df.empty:
+            return plots
 
         # Visualization: Distribution of Released IVs
         if 'iv_percentage' in df.columns:
-            # Ensure native Python list of floats for serialization
-            clean_ivs = pd.to_numeric(df['iv_percentage'], errors='coerce').dropna().tolist()
+            # iv_percentage is already numeric; drop non-finite values and hand Plotly the ndarray
+            clean_ivs = df['iv_percentage'].to_numpy(dtype=np.float32, na_value=np.nan)
+            clean_ivs = clean_ivs[np.isfinite(clean_ivs)]
 
-            fig = go.Figure(data=[go.Histogram(
-                x=clean_ivs,
-                marker_color='brown',
-                xbins=dict(start=0, end=100, size=5)
-            )])
+            # Fixed 5% bins over the 0-100 range
+            fig = go.Figure(data=[hist_trace(clean_ivs, np.arange(0, 105, 5), marker_color='brown')])
             fig.update_layout(
                 title="Distribution of Released Pokémon IVs (The 'Discarded')",
                 xaxis_title="IV Percentage",
                 yaxis_title="Frequency"
             )
-            plots['released_ivs'] = fig.to_json()
+            plots['released_ivs'] = to_plot_json(fig)
 
         return plots
\ No newline at end of file
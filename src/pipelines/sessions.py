@@ -1,11 +1,16 @@
 import pandas as pd
 import plotly.graph_objects as go
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 from src.pipelines.base_pipeline import BaseDataPipeline
+from src.pipelines.plotting import hist_trace, to_plot_json
 from src.config import Config
 from src.connectors.api_client import APIClient
 
+# Shared categories so the concatenated event stream stays a single categorical
+EVENT_TYPES = pd.CategoricalDtype(['LOGIN', 'LOGOUT'])
+
 
 class SessionsPipeline(BaseDataPipeline):
     """
@@ -24,44 +29,61 @@ class SessionsPipeline(BaseDataPipeline):
 
         Since session data consists of two distinct event types, this method
         fetches them separately (checking local cache first) and combines them
-        into a single chronological event stream.
+        into a single chronological event stream. Both downloads are I/O-bound,
+        so they run concurrently.
 
         Returns:
             pd.DataFrame: A combined DataFrame containing both LOGIN and LOGOUT events.
         """
-        client = APIClient()
-
-        # Load Login Data
-        login_path = os.path.join(Config.RAW_DIR, "dataset_SESSION_LOGIN_raw.csv")
-        if not os.path.exists(login_path):
-            logins = pd.DataFrame(client.fetch_data("SESSION_LOGIN"))
-            logins.to_csv(login_path, index=False)
-        else:
-            logins = pd.read_csv(login_path)
-
-        # Load Logout Data
-        logout_path = os.path.join(Config.RAW_DIR, "dataset_SESSION_LOGOUT_raw.csv")
-        if not os.path.exists(logout_path):
-            logouts = pd.DataFrame(client.fetch_data("SESSION_LOGOUT"))
-            logouts.to_csv(logout_path, index=False)
-        else:
-            logouts = pd.read_csv(logout_path)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            logins, logouts = executor.map(self._load_or_fetch, ["SESSION_LOGIN", "SESSION_LOGOUT"])
 
         # Tag events for identification
         if not logins.empty:
-            logins['event_type'] = 'LOGIN'
+            logins['event_type'] = pd.Series('LOGIN', index=logins.index, dtype=EVENT_TYPES)
         if not logouts.empty:
-            logouts['event_type'] = 'LOGOUT'
+            logouts['event_type'] = pd.Series('LOGOUT', index=logouts.index, dtype=EVENT_TYPES)
 
         return pd.concat([logins, logouts], ignore_index=True)
 
+    def _load_or_fetch(self, action_type: str) -> pd.DataFrame:
+        """
+        Loads one session event type from its Parquet cache, fetching it if missing.
+
+        Timestamps are stored as datetimes so later runs skip re-parsing them.
+        CSV caches written by older versions are still read when present.
+
+        Args:
+            action_type: The event identifier (e.g., 'SESSION_LOGIN').
+
+        Returns:
+            pd.DataFrame: The raw events for that action type.
+        """
+        path = os.path.join(Config.RAW_DIR, f"dataset_{action_type}_raw.parquet")
+        if os.path.exists(path):
+            return pd.read_parquet(path, engine='pyarrow')
+
+        legacy_path = os.path.join(Config.RAW_DIR, f"dataset_{action_type}_raw.csv")
+        if os.path.exists(legacy_path):
+            return self._read_csv(legacy_path)
+
+        events = pd.DataFrame(APIClient().fetch_data(action_type))
+        if events.empty:
+            return events
+
+        if 'timestamp' in events.columns:
+            events['timestamp'] = pd.to_datetime(events['timestamp'])
+        self._write_raw_cache(events, path)
+        return events
+
     def _feature_engineering(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Reconstructs session durations by pairing login and logout events.
 
-        Iterates through player events chronologically to match a LOGIN with its
-        subsequent LOGOUT. It filters out invalid sessions (e.g., missing logouts
-        or excessive durations).
+        Events are sorted per player chronologically and each LOGIN is paired with
+        the player's next event when that event is a LOGOUT, using a grouped shift
+        instead of iterating rows. Invalid sessions (e.g., missing logouts or
+        excessive durations) are filtered out.
 
         Args:
             df (pd.DataFrame): The combined raw event stream.
@@ -74,33 +96,33 @@ class SessionsPipeline(BaseDataPipeline):
             df['dt'] = pd.to_datetime(df['timestamp'])
 
         # Sort by Player and Time to align events
-        df = df.sort_values(by=['player_uuid', 'dt'])
-        session_data = []
-
-        for player, group in df.groupby('player_uuid'):
-            group = group.sort_values('dt')
-            login_dt = None
-
-            for _, row in group.iterrows():
-                if row['event_type'] == 'LOGIN':
-                    login_dt = row['dt']
-                elif row['event_type'] == 'LOGOUT' and login_dt is not None:
-                    # Calculate duration in minutes
-                    duration_min = (row['dt'] - login_dt).total_seconds() / 60
-
-                    # Filter valid sessions (between 0 minutes and 24 hours)
-                    if 0 < duration_min < 1440:
-                        session_data.append({
-                            'player_uuid': player,
-                            'duration_minutes': duration_min,
-                            'hour_of_day': login_dt.hour,
-                            'day_of_week': login_dt.day_name()
-                        })
-
-                    # Reset login timestamp for the next session
-                    login_dt = None
-
-        return pd.DataFrame(session_data)
+        df = df.sort_values(by=['player_uuid', 'dt'], kind='stable')
+
+        # Look ahead to each player's next event
+        grouped = df.groupby('player_uuid', sort=False)
+        next_event = grouped['event_type'].shift(-1)
+        next_dt = grouped['dt'].shift(-1)
+
+        # Calculate duration in minutes
+        duration_min = (next_dt - df['dt']).dt.total_seconds() / 60
+
+        # A session is a LOGIN directly followed by a LOGOUT, lasting between 0 minutes and 24 hours
+        is_session = (
+            df['event_type'].eq('LOGIN')
+            & next_event.eq('LOGOUT')
+            & (duration_min > 0)
+            & (duration_min < 1440)
+        )
+
+        login_dt = df.loc[is_session, 'dt']
+        days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+        return pd.DataFrame({
+            'player_uuid': df.loc[is_session, 'player_uuid'].to_numpy(),
+            'duration_minutes': duration_min[is_session].to_numpy(),
+            'hour_of_day': login_dt.dt.hour.to_numpy(),
+            'day_of_week': pd.Categorical(login_dt.dt.day_name(), categories=days_order)
+        })
 
     def _generate_visualization_data(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -122,45 +144,32 @@ class SessionsPipeline(BaseDataPipeline):
 
         # Visualization: Session Duration Distribution
         if 'duration_minutes' in df.columns:
-            durations = df['duration_minutes'].tolist()
-            fig = go.Figure(data=[go.Histogram(
-                x=durations,
-                marker_color='teal',
-                nbinsx=30
-            )])
+            durations = df['duration_minutes'].to_numpy()
+            fig = go.Figure(data=[hist_trace(durations, 30, marker_color='teal')])
             fig.update_layout(
                 title="Player Session Duration (Minutes)",
                 xaxis_title="Minutes",
                 yaxis_title="Count",
                 xaxis=dict(range=[0, 180])  # Visually limit to 3 hours for clarity
             )
-            plots['duration_dist'] = fig.to_json()
+            plots['duration_dist'] = to_plot_json(fig)
 
         # Visualization: Activity Heatmap (Day vs Hour)
         if 'day_of_week' in df.columns and 'hour_of_day' in df.columns:
-            # Prepare matrix manually to ensure native Python types for serialization
+            # Build the Day x Hour login count matrix
             days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            pivot = df.pivot_table(
-                index='day_of_week',
-                columns='hour_of_day',
-                values='player_uuid',
-                aggfunc='count',
-                fill_value=0
+            pivot = (
+                df.groupby(['day_of_week', 'hour_of_day'], observed=True)
+                .size()
+                .unstack(fill_value=0)
+                # Enforce day order and all 24 hours, filling gaps with zero logins
+                .reindex(index=days_order, columns=range(24), fill_value=0)
             )
 
-            # Reindex to ensure correct day order and fill missing values
-            pivot = pivot.reindex(days_order).fillna(0)
-
-            # Ensure all 24 hours are present in the columns
-            for h in range(24):
-                if h not in pivot.columns:
-                    pivot[h] = 0
-            pivot = pivot[sorted(pivot.columns)]
-
             fig2 = go.Figure(data=go.Heatmap(
-                z=pivot.values.tolist(),
-                x=pivot.columns.tolist(),
-                y=pivot.index.tolist(),
+                z=pivot.to_numpy(),
+                x=pivot.columns.to_numpy(),
+                y=pivot.index.to_numpy(),
                 colorscale='YlOrRd'
             ))
             fig2.update_layout(
@@ -168,6 +177,6 @@ class SessionsPipeline(BaseDataPipeline):
                 xaxis_title="Hour of Day",
                 yaxis_title="Day of Week"
             )
-            plots['heatmap'] = fig2.to_json()
+            plots['heatmap'] = to_plot_json(fig2)
 
         return plots
\ No newline at end of file
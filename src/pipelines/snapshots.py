@@ -1,7 +1,30 @@
+import logging
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+from pandas.api.types import is_numeric_dtype
 from typing import Dict, Any
-from src.pipelines.base_pipeline import BaseDataPipeline
+from src.config import Config
+from src.pipelines.base_pipeline import BaseDataPipeline, pl
+from src.pipelines.plotting import hist_trace, to_plot_json
+
+log = logging.getLogger(__name__)
+
+# Columns charted by the snapshot report
+PLOT_COLUMNS = frozenset({'totalDistance_km', 'fly_ratio'})
+
+
+def _numeric_values(col: pd.Series) -> np.ndarray:
+    """
+    Returns a column as a new float64 ndarray with missing values set to 0.
+
+    Columns that are already numeric are read directly; only text columns go
+    through pd.to_numeric (unparseable values also become 0). The result never
+    shares memory with the DataFrame, so callers may modify it in place.
+    """
+    if not is_numeric_dtype(col):
+        col = pd.to_numeric(col, errors='coerce')
+    return col.to_numpy(dtype=np.float64, na_value=0.0, copy=True)
 
 
 class SnapshotsPipeline(BaseDataPipeline):
@@ -11,6 +34,9 @@ class SnapshotsPipeline(BaseDataPipeline):
     Metrics include distance traveled and movement methods (Walking vs Flying).
     """
 
+    supports_polars = True
+    use_polars = Config.USE_POLARS
+
     def __init__(self):
         super().__init__(action_type="SESSION_SNAPSHOT", output_name="snapshots")
 
@@ -19,64 +45,86 @@ class SnapshotsPipeline(BaseDataPipeline):
         Converts distance units to Kilometers and ensures numeric types.
         """
         if df.empty: return df
+        cols = set(df.columns)
 
         # Convert distance to KM
-        if 'totalDistanceCm' in df.columns:
-            df['totalDistance_km'] = pd.to_numeric(df['totalDistanceCm'], errors='coerce').fillna(0) / 100000
-        elif 'totalDistance_km' in df.columns:
-            df['totalDistance_km'] = pd.to_numeric(df['totalDistance_km'], errors='coerce').fillna(0)
+        if 'totalDistanceCm' in cols:
+            distance = _numeric_values(df['totalDistanceCm'])
+            # Convert in place: the buffer is ours, so no second column is allocated
+            np.multiply(distance, 1e-5, out=distance)
+            df['totalDistance_km'] = distance
+        elif 'totalDistance_km' in cols:
+            df['totalDistance_km'] = _numeric_values(df['totalDistance_km'])
 
         # Ensure Fly Ratio is numeric
-        if 'fly_ratio' in df.columns:
-            df['fly_ratio'] = pd.to_numeric(df['fly_ratio'], errors='coerce').fillna(0)
+        if 'fly_ratio' in cols:
+            df['fly_ratio'] = _numeric_values(df['fly_ratio'])
 
-        return df
+        # Store repetitive labels as categoricals
+        return self._to_categorical(df)
+
+    def _polars_context_schema(self) -> Dict[str, Any]:
+        return {'totalDistanceCm': pl.Float64, 'totalDistance_km': pl.Float64, 'fly_ratio': pl.Float64}
+
+    def _feature_engineering_polars(self, lf: "pl.LazyFrame") -> "pl.LazyFrame":
+        """
+        Polars version of the distance conversion and fly ratio normalization.
+        """
+        distance_cm = pl.col('totalDistanceCm')
+        return lf.with_columns(
+            pl.when(distance_cm.is_not_null())
+            .then(distance_cm * 1e-5)
+            .otherwise(pl.col('totalDistance_km'))
+            .fill_null(0)
+            .alias('totalDistance_km'),
+            pl.col('fly_ratio').fill_null(0),
+        )
 
     def _generate_visualization_data(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
         Visualizes Distance Traveled and Fly Ratio.
         """
         plots = {}
-        print(f"--- [DEBUG] SNAPSHOTS PIPELINE: Processing {len(df)} rows ---")
+        # Nothing to plot without rows or without either metric column
+        plot_cols = PLOT_COLUMNS & set(df.columns)
+        if df.empty or not plot_cols:
+            return plots
+        log.debug("SNAPSHOTS PIPELINE: Processing %d rows", len(df))
 
         # Distance Traveled Histogram
-        if 'totalDistance_km' in df.columns:
-            dist_data = df['totalDistance_km'].tolist()
-
-            # Filter negligible distances for cleaner graphs
-            dist_data = [d for d in dist_data if d > 0.1]
-
-            if dist_data:
-                fig = go.Figure(data=[go.Histogram(
-                    x=dist_data,
-                    nbinsx=30,
-                    marker_color='#2ecc71',
-                    name='Distance (km)'
-                )])
-                fig.update_layout(
-                    title="Player Distance Traveled Distribution (km)",
-                    xaxis_title="Kilometers",
-                    template="plotly_white"
+        if 'totalDistance_km' in plot_cols:
+            dist_data = df['totalDistance_km'].to_numpy(dtype=np.float64, na_value=np.nan)
+
+            # Filter missing and negligible distances for cleaner graphs
+            dist_data = dist_data[np.isfinite(dist_data) & (dist_data > 0.1)]
+
+            if dist_data.size:
+                fig = go.Figure(
+                    data=[hist_trace(dist_data, 30, marker_color='#2ecc71', name='Distance (km)')],
+                    # Unvalidated layouts are sent as-is, so use the full {'text': ...} title form
+                    layout=dict(
+                        title=dict(text="Player Distance Traveled Distribution (km)"),
+                        xaxis=dict(title=dict(text="Kilometers"))
+                    ),
+                    _validate=False
                 )
-                plots['distance_dist'] = fig.to_json()
+                plots['distance_dist'] = to_plot_json(fig)
 
         # Fly Ratio Histogram
-        if 'fly_ratio' in df.columns:
-            fly_data = df['fly_ratio'].tolist()
-
-            if fly_data:
-                fig2 = go.Figure(data=[go.Histogram(
-                    x=fly_data,
-                    nbinsx=20,
-                    marker_color='#9b59b6',
-                    name='Fly Ratio'
-                )])
-                fig2.update_layout(
-                    title="Fly Ratio Distribution (0=Walk, 1=Fly)",
-                    xaxis_title="Fly Ratio",
-                    yaxis_title="Count",
-                    template="plotly_white"
+        if 'fly_ratio' in plot_cols:
+            fly_data = df['fly_ratio'].to_numpy(dtype=np.float64, na_value=np.nan)
+            fly_data = fly_data[np.isfinite(fly_data)]
+
+            if fly_data.size:
+                fig2 = go.Figure(
+                    data=[hist_trace(fly_data, 20, marker_color='#9b59b6', name='Fly Ratio')],
+                    layout=dict(
+                        title=dict(text="Fly Ratio Distribution (0=Walk, 1=Fly)"),
+                        xaxis=dict(title=dict(text="Fly Ratio")),
+                        yaxis=dict(title=dict(text="Count"))
+                    ),
+                    _validate=False
                 )
-                plots['fly_ratio'] = fig2.to_json()
+                plots['fly_ratio'] = to_plot_json(fig2)
 
         return plots
\ No newline at end of file
@@ -1,23 +1,51 @@
 import os
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from src.config import Config
 
+_TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), 'templates')
+
+# Shared across generators; compiled template bytecode is cached on disk so
+# later runs skip lexing, parsing and code generation. Templates are not
+# edited while a report is generated, so they are never re-checked on disk.
+_ENV = Environment(
+    loader=FileSystemLoader(_TEMPLATE_DIR),
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=False,
+    cache_size=50
+)
+
 class HTMLGenerator:
     """Generates the final HTML report from collected JSON plots."""
 
     def __init__(self):
-        self.template_dir = os.path.join(os.path.dirname(__file__), 'templates')
-        self.env = Environment(loader=FileSystemLoader(self.template_dir))
+        self.template_dir = _TEMPLATE_DIR
+        self.env = _ENV
+
+    def render_section(self, section_name: str, plots: dict) -> str:
+        """
+        Renders one pipeline's section of the report.
+
+        Args:
+            section_name (str): The pipeline name used as section heading.
+            plots (dict): The pipeline's serialized Plotly figures.
+
+        Returns:
+            str: The rendered <section> fragment.
+        """
+        template = self.env.get_template('report_section.html')
+        return template.render(section_name=section_name, plots=plots)
 
     def generate_report(self, consolidated_data: dict):
         """
         Renders the Jinja template with the consolidated plot data.
+
+        Each section is rendered on its own as the outer template streams the
+        document to disk, so only one rendered section is held at a time.
         """
-        template = self.env.get_template('report_template.html')
-        html_content = template.render(all_data=consolidated_data)
+        sections = (self.render_section(name, plots) for name, plots in consolidated_data.items())
 
         output_path = os.path.join(Config.REPORT_DIR, 'ai_training_report.html')
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        template = self.env.get_template('report_template.html')
+        template.stream(sections=sections).dump(output_path, encoding='utf-8')
 
-        print(f"[SUCCESS] Report generated at: {output_path}")
\ No newline at end of file
+        print(f"[SUCCESS] Report generated at: {output_path}")